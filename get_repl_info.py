@@ -0,0 +1,37 @@
+
+#!/usr/bin/env python3
+"""
+Replit environment info - single cached lookup for the Repl identity and URLs
+"""
+
+import os
+import functools
+from typing import NamedTuple
+
+class ReplInfo(NamedTuple):
+    id: str
+    owner: str
+    slug: str
+    url: str
+    webhook_url: str
+
+@functools.lru_cache(maxsize=1)
+def get_repl_info() -> ReplInfo:
+    """Read the Replit environment once and cache the result"""
+    url = os.getenv('REPL_URL', 'your-repl-url')
+    return ReplInfo(
+        id=os.getenv('REPL_ID', ''),
+        owner=os.getenv('REPL_OWNER', ''),
+        slug=os.getenv('REPL_SLUG', ''),
+        url=url,
+        webhook_url=f"{url}/github-sync"
+    )
+
+if __name__ == "__main__":
+    info = get_repl_info()
+    print("🔍 Replit Environment Info:")
+    print(f"   id: {info.id}")
+    print(f"   owner: {info.owner}")
+    print(f"   slug: {info.slug}")
+    print(f"   url: {info.url}")
+    print(f"   webhook_url: {info.webhook_url}")
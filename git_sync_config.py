@@ -6,12 +6,30 @@ Git Sync Configuration for Replit
 
 import os
 import json
+import copy
+import atexit
+import fnmatch
+import functools
+import re
+
+try:
+    import orjson
+
+    def _dump_config(config):
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_config(config):
+        return json.dumps(config, indent=2).encode('utf-8')
 
 class GitSyncConfig:
     """Configuration for git sync service"""
-    
+
+    # Parsed config files shared across instances, keyed by (path, mtime)
+    _cache = {}
+
     def __init__(self):
         self.config_file = "git_sync_config.json"
+        self._dirty = False
         self.default_config = {
             "enabled": True,
             "sync_interval": 60,  # 1 minute
@@ -29,14 +47,38 @@ class GitSyncConfig:
             ]
         }
         self.config = self.load_config()
+        self._ignore_regex = self._compile_ignore_patterns()
+        atexit.register(self.flush)
+
+    def _compile_ignore_patterns(self):
+        """Combine the ignore glob patterns into a single compiled regex"""
+        patterns = self.config.get("ignore_patterns", [])
+        if not patterns:
+            return None
+        return re.compile('|'.join(fnmatch.translate(p) for p in patterns))
+
+    def is_ignored(self, path):
+        """Check whether a path matches any configured ignore pattern"""
+        return bool(self._ignore_regex and self._ignore_regex.match(path))
     
     def load_config(self):
         """Load configuration from file or create default"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                # Merge with defaults to ensure all keys exist
+                # Reuse the parsed config while the file is unchanged on disk
+                cache_key = (self.config_file, os.stat(self.config_file).st_mtime_ns)
+                cached = GitSyncConfig._cache.get(cache_key)
+                if cached is not None:
+                    config = copy.deepcopy(cached)
+                else:
+                    with open(self.config_file, 'r') as f:
+                        config = json.load(f)
+                    # Cache a private copy so instance mutations can't leak in
+                    GitSyncConfig._cache[cache_key] = copy.deepcopy(config)
+                # Saved configs normally carry every key already - only
+                # merge with defaults when one is missing
+                if self.default_config.keys() <= config.keys():
+                    return config
                 merged_config = self.default_config.copy()
                 merged_config.update(config)
                 return merged_config
@@ -51,11 +93,20 @@ class GitSyncConfig:
         """Save configuration to file"""
         try:
             config = config or self.config
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write to a temp file and rename so readers never see a partial file
+            temp_file = f"{self.config_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(_dump_config(config))
+            os.replace(temp_file, self.config_file)
+            self._dirty = False
         except Exception as e:
             print(f"⚠️ Error saving git sync config: {e}")
     
+    def flush(self):
+        """Write pending configuration changes to disk"""
+        if self._dirty:
+            self.save_config()
+    
     def get(self, key, default=None):
         """Get configuration value"""
         return self.config.get(key, default)
@@ -63,12 +114,16 @@ class GitSyncConfig:
     def set(self, key, value):
         """Set configuration value"""
         self.config[key] = value
-        self.save_config()
-    
+        self._dirty = True
+        if key == "ignore_patterns":
+            self._ignore_regex = self._compile_ignore_patterns()
+
     def update(self, updates):
         """Update multiple configuration values"""
         self.config.update(updates)
-        self.save_config()
+        self._dirty = True
+        if "ignore_patterns" in updates:
+            self._ignore_regex = self._compile_ignore_patterns()
     
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
@@ -78,6 +133,7 @@ class GitSyncConfig:
 # Global config instance
 git_sync_config = GitSyncConfig()
 
+@functools.lru_cache(maxsize=1)
 def get_config():
     """Get git sync configuration"""
     return git_sync_config
@@ -22,29 +22,34 @@ class GitSyncService:
         self.sync_thread = None
         self.sync_instance = None
         self.running = False
-    
+        self._wake = threading.Event()
+        # Serialize start/stop so concurrent callers can't spawn two workers
+        self._lock = threading.RLock()
+
     def start_background_sync(self):
         """Start git sync in background thread"""
-        if self.running:
-            logger.warning("⚠️ Git sync service already running")
-            return
-        
-        logger.info("🚀 Starting background git sync service...")
-        
-        self.sync_instance = AutoGitSync(
-            sync_interval=self.sync_interval,
-            auto_commit=True
-        )
-        
-        self.running = True
-        self.sync_thread = threading.Thread(
-            target=self._sync_worker,
-            daemon=True,
-            name="GitSyncService"
-        )
-        self.sync_thread.start()
-        
-        logger.info("✅ Background git sync service started")
+        with self._lock:
+            if self.running:
+                logger.warning("⚠️ Git sync service already running")
+                return
+
+            logger.info("🚀 Starting background git sync service...")
+
+            self.sync_instance = AutoGitSync(
+                sync_interval=self.sync_interval,
+                auto_commit=True
+            )
+
+            self.running = True
+            self._wake.clear()
+            self.sync_thread = threading.Thread(
+                target=self._sync_worker,
+                daemon=True,
+                name="GitSyncService"
+            )
+            self.sync_thread.start()
+
+            logger.info("✅ Background git sync service started")
     
     def _sync_worker(self):
         """Worker function for sync thread"""
@@ -53,8 +58,9 @@ class GitSyncService:
                 if self.sync_instance:
                     self.sync_instance.sync_cycle()
                 
-                # Wait for next cycle
-                time.sleep(self.sync_interval)
+                # Wait for next cycle; waking early on stop or manual trigger
+                if self._wake.wait(self.sync_interval):
+                    self._wake.clear()
                 
         except Exception as e:
             logger.error(f"❌ Git sync service error: {str(e)}")
@@ -63,20 +69,26 @@ class GitSyncService:
     
     def stop_background_sync(self):
         """Stop background git sync service"""
-        if not self.running:
-            logger.warning("⚠️ Git sync service not running")
-            return
-        
-        logger.info("🛑 Stopping background git sync service...")
-        self.running = False
-        
-        if self.sync_instance:
-            self.sync_instance.stop_sync()
-        
-        if self.sync_thread and self.sync_thread.is_alive():
-            self.sync_thread.join(timeout=5)
-        
-        logger.info("✅ Background git sync service stopped")
+        with self._lock:
+            if not self.running:
+                logger.warning("⚠️ Git sync service not running")
+                return
+
+            logger.info("🛑 Stopping background git sync service...")
+            self.running = False
+            self._wake.set()
+
+            if self.sync_instance:
+                self.sync_instance.stop_sync()
+
+            if self.sync_thread and self.sync_thread.is_alive():
+                self.sync_thread.join(timeout=5)
+
+            logger.info("✅ Background git sync service stopped")
+    
+    def trigger_now(self):
+        """Wake the sync thread for an immediate cycle"""
+        self._wake.set()
     
     def is_running(self):
         """Check if service is running"""
@@ -1,39 +1,171 @@
 
 import os
+import json
+import shutil
+import signal
 import subprocess
+import sys
 import hmac
 import hashlib
-from flask import Flask, request, jsonify
 import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# libgit2 lets us sync in-process instead of fork/exec'ing git several
+# times per webhook; fall back to subprocess git when it's not installed
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# orjson serializes response bodies several times faster than the stdlib
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data):
+        return json.loads(data)
+
+# Resolved once at import - the Repl URL never changes for a running process
+REPL_URL = os.environ.get('REPL_URL', 'your-repl-url')
+
+# Resolve tool paths once so each subprocess skips the PATH walk
+_GIT = shutil.which('git') or 'git'
+_PIP = shutil.which('pip') or 'pip'
+# uv resolves no-op installs dramatically faster than pip; use it if present
+_UV = shutil.which('uv')
+
+# Dependency install and the restart check are independent after a pull;
+# one small shared pool lets them overlap
+_DEPLOY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='deploy')
+
+# Signature checks are compute-bound on SHA-256. The OpenSSL-backed _hashlib
+# module picks hardware SHA extensions (SHA-NI and friends) at runtime via
+# CPUID; the pure-Python fallback does not. Record which one we got so slow
+# verification is diagnosable from the logs.
+try:
+    import _hashlib  # noqa: F401 - probe for the OpenSSL backend
+    _SHA256_BACKEND = 'openssl'
+except ImportError:
+    _SHA256_BACKEND = 'builtin'
+logger.info("🔐 SHA-256 backend for webhook verification: %s", _SHA256_BACKEND)
+
 class GitHubSyncHandler:
     """Handle GitHub webhook events and sync with Replit"""
-    
+
+    # Remember recently processed pushes so GitHub's retry deliveries
+    # don't re-run the whole pull/install pipeline
+    RECENT_PUSH_LIMIT = 64
+    RECENT_PUSH_TTL = 300  # seconds
+
+    # PID file for the managed application process - lets us restart the
+    # exact process we started instead of pattern-matching with pkill
+    APP_SCRIPT = 'jira_webhook_server.py'
+    PID_FILE = 'jira_webhook_server.pid'
+
     def __init__(self):
+        self._recent_pushes = OrderedDict()
         self.github_secret = os.getenv('GITHUB_WEBHOOK_SECRET')
         self.auto_deploy = os.getenv('AUTO_DEPLOY_ON_PUSH', 'true').lower() == 'true'
         self.target_branch = os.getenv('TARGET_BRANCH', 'main')
-        
+        # Encode the secret once; verify_signature runs per webhook
+        self._secret_bytes = self.github_secret.encode('utf-8') if self.github_secret else None
+        # Precompute the HMAC inner/outer pad states - the secret is fixed
+        # for the process lifetime, so the key-pad compressions only need to
+        # happen once instead of on every webhook
+        self._ipad_state = None
+        self._opad_state = None
+        if self._secret_bytes:
+            key = self._secret_bytes
+            if len(key) > hashlib.sha256().block_size:
+                key = hashlib.sha256(key).digest()
+            key = key.ljust(hashlib.sha256().block_size, b'\x00')
+            self._ipad_state = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+            self._opad_state = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+        # Open the repository handle once and reuse it across webhooks
+        self._repo = None
+        if pygit2 is not None:
+            try:
+                self._repo = pygit2.Repository('.')
+            except Exception:
+                logger.warning("⚠️ pygit2 could not open the repository - using git subprocesses")
+
     def verify_signature(self, payload_body, signature_header):
         """Verify GitHub webhook signature"""
-        if not self.github_secret:
+        if not self._secret_bytes:
             logger.warning("GitHub webhook secret not configured - skipping verification")
             return True
-            
-        if not signature_header:
+
+        # Length + prefix check rejects malformed headers before paying for
+        # the SHA compress; both depend only on attacker input, so no secret
+        # state can leak through the early exit
+        if not signature_header or len(signature_header) != 71 or not signature_header.startswith('sha256='):
             return False
-            
-        hash_object = hmac.new(
-            self.github_secret.encode('utf-8'),
-            payload_body,
-            hashlib.sha256
-        )
-        expected_signature = "sha256=" + hash_object.hexdigest()
-        
-        return hmac.compare_digest(expected_signature, signature_header)
+
+        # HMAC from the cached pad states: copy, hash payload, hash inner
+        # digest - skips re-deriving the key pads per request
+        inner = self._ipad_state.copy()
+        inner.update(payload_body)
+        outer = self._opad_state.copy()
+        outer.update(inner.digest())
+
+        # Compare raw digests rather than hex-encoding ours per request
+        try:
+            provided = bytes.fromhex(signature_header[7:])
+        except ValueError:
+            return False
+
+        return hmac.compare_digest(outer.digest(), provided)
+
+    def verify_signature_stream(self, stream, signature_header, keep_body=True):
+        """Verify the webhook signature while the body streams in.
+
+        Returns (valid, body); body holds the collected bytes when keep_body
+        is true, otherwise the chunks are discarded after hashing.
+        """
+        if self._secret_bytes:
+            # Same cheap length + prefix rejection as verify_signature
+            if not signature_header or len(signature_header) != 71 or not signature_header.startswith('sha256='):
+                return False, None
+            try:
+                provided = bytes.fromhex(signature_header[7:])
+            except ValueError:
+                return False, None
+            inner = self._ipad_state.copy()
+        else:
+            inner = None
+
+        chunks = [] if keep_body else None
+        while True:
+            chunk = stream.read(65536)
+            if not chunk:
+                break
+            if inner is not None:
+                inner.update(chunk)
+            if chunks is not None:
+                chunks.append(chunk)
+
+        body = b''.join(chunks) if chunks is not None else None
+
+        if inner is None:
+            logger.warning("GitHub webhook secret not configured - skipping verification")
+            return True, body
+
+        outer = self._opad_state.copy()
+        outer.update(inner.digest())
+        return hmac.compare_digest(outer.digest(), provided), body
     
     def fetch_all_branches(self):
         """Fetch all branches and prune deleted ones"""
@@ -41,17 +173,17 @@ class GitHubSyncHandler:
             logger.info("🔄 Fetching all branches from GitHub...")
             
             # Fetch all branches and prune deleted ones
-            fetch_result = subprocess.run(['git', 'fetch', 'origin', '--prune'], 
+            fetch_result = subprocess.run([_GIT, 'fetch', 'origin', '--prune'], 
                                         capture_output=True, text=True)
             if fetch_result.returncode != 0:
-                logger.warning(f"⚠️ Git fetch warning: {fetch_result.stderr}")
+                logger.warning("⚠️ Git fetch warning: %s", fetch_result.stderr)
                 return {"status": "warning", "output": fetch_result.stderr}
             
             # Get list of remote branches
-            remote_branches = subprocess.run(['git', 'branch', '-r'], 
+            remote_branches = subprocess.run([_GIT, 'branch', '-r'], 
                                            capture_output=True, text=True)
             
-            logger.info(f"📋 Available remote branches:\n{remote_branches.stdout}")
+            logger.info("📋 Available remote branches:\n%s", remote_branches.stdout)
             
             return {"status": "success", "output": fetch_result.stdout, "remote_branches": remote_branches.stdout}
             
@@ -60,68 +192,121 @@ class GitHubSyncHandler:
             logger.error(f"❌ {error_msg}")
             return {"status": "error", "error": error_msg}
 
+    def _pull_with_pygit2(self):
+        """Pull latest changes in-process through libgit2"""
+        try:
+            logger.info("📥 Pulling latest changes from GitHub...")
+
+            repo = self._repo
+            repo.remotes['origin'].fetch(prune=pygit2.GIT_FETCH_PRUNE)
+            remote_ref = repo.lookup_reference(f'refs/remotes/origin/{self.target_branch}')
+
+            logger.info("📍 Current branch: %s", repo.head.shorthand)
+
+            # Switch to target branch if needed
+            if repo.head.shorthand != self.target_branch:
+                branch = repo.lookup_branch(self.target_branch)
+                if branch is not None:
+                    repo.checkout(branch)
+                else:
+                    logger.warning("⚠️ Could not switch to %s: branch not found", self.target_branch)
+
+            analysis, _ = repo.merge_analysis(remote_ref.target)
+
+            if analysis & pygit2.GIT_MERGE_ANALYSIS_UP_TO_DATE:
+                logger.info("✅ Git pull successful")
+                return {"status": "success", "branch": self.target_branch}
+
+            if analysis & pygit2.GIT_MERGE_ANALYSIS_FASTFORWARD:
+                repo.checkout_tree(repo.get(remote_ref.target))
+                local_ref = repo.lookup_reference(f'refs/heads/{self.target_branch}')
+                local_ref.set_target(remote_ref.target)
+                repo.head.set_target(remote_ref.target)
+                logger.info("✅ Git pull successful")
+                return {"status": "success", "branch": self.target_branch}
+
+            # Diverged history - prefer the remote state, matching the
+            # reset fallback of the subprocess path
+            repo.reset(remote_ref.target, pygit2.GIT_RESET_HARD)
+            logger.info("✅ Git reset successful - repository synced")
+            return {
+                "status": "success",
+                "output": "Repository reset to match remote",
+                "branch": self.target_branch
+            }
+
+        except Exception as e:
+            error_msg = f"Unexpected error during git pull: {str(e)}"
+            logger.error(f"❌ {error_msg}")
+            return {"status": "error", "error": error_msg}
+
     def pull_latest_changes(self):
         """Pull latest changes from GitHub with full branch sync"""
+        if self._repo is not None:
+            return self._pull_with_pygit2()
+
+        # One shell invocation instead of a subprocess per git command;
+        # markers delimit the stages so a failure can be attributed to the
+        # last stage that started
+        script = (
+            f'{_GIT} rev-parse --git-dir > /dev/null && '
+            'echo ---FETCH--- && '
+            f'{_GIT} fetch origin --prune && '
+            'echo ---BRANCH--- && '
+            f'{_GIT} branch -r && '
+            'echo ---CHECKOUT--- && '
+            f'{_GIT} checkout {self.target_branch} > /dev/null && '
+            'echo ---PULL--- && '
+            f'{_GIT} pull origin {self.target_branch} > /dev/null'
+        )
         try:
             logger.info("📥 Pulling latest changes from GitHub...")
-            
-            # First, check if we have a git repository
-            git_check = subprocess.run(['git', 'status'], capture_output=True, text=True)
-            if git_check.returncode != 0:
+
+            result = subprocess.run(['sh', '-c', script],
+                                  capture_output=True, text=True)
+
+            if '---FETCH---' not in result.stdout:
                 logger.error("❌ Not a git repository")
                 return {"status": "error", "error": "Not a git repository"}
-            
-            # Fetch all branches first (including new ones)
-            fetch_result = self.fetch_all_branches()
-            if fetch_result["status"] == "error":
-                return fetch_result
-            
-            # Check current branch
-            current_branch = subprocess.run(['git', 'branch', '--show-current'], 
-                                          capture_output=True, text=True).stdout.strip()
-            
-            logger.info(f"📍 Current branch: {current_branch}")
-            
-            # Switch to target branch if needed
-            if current_branch != self.target_branch:
-                checkout_result = subprocess.run(['git', 'checkout', self.target_branch], 
-                                               capture_output=True, text=True)
-                if checkout_result.returncode != 0:
-                    logger.warning(f"⚠️ Could not switch to {self.target_branch}: {checkout_result.stderr}")
-            
-            # Pull latest changes
-            result = subprocess.run(['git', 'pull', 'origin', self.target_branch], 
-                                  capture_output=True, text=True)
-            
+
+            remote_branches, _, _ = result.stdout.partition('---BRANCH---')[2].partition('---CHECKOUT---')
+            logger.info("📋 Available remote branches:\n%s", remote_branches.strip())
+            fetch_result = {"status": "success", "remote_branches": remote_branches.strip()}
+
             if result.returncode == 0:
-                logger.info(f"✅ Git pull successful: {result.stdout}")
+                logger.info("✅ Git pull successful")
                 return {
-                    "status": "success", 
-                    "output": result.stdout, 
+                    "status": "success",
                     "branch": self.target_branch,
                     "fetch_result": fetch_result
                 }
-            else:
-                # Try to handle merge conflicts or other issues
-                logger.warning(f"⚠️ Git pull had issues: {result.stderr}")
-                
-                # Reset to remote state if there are conflicts
-                reset_result = subprocess.run(['git', 'reset', '--hard', f'origin/{self.target_branch}'], 
-                                            capture_output=True, text=True)
-                
-                if reset_result.returncode == 0:
-                    logger.info("✅ Git reset successful - repository synced")
-                    return {
-                        "status": "success", 
-                        "output": "Repository reset to match remote", 
-                        "branch": self.target_branch,
-                        "fetch_result": fetch_result
-                    }
-                else:
-                    error_msg = f"Git operations failed: {result.stderr}"
-                    logger.error(f"❌ {error_msg}")
-                    return {"status": "error", "error": error_msg}
-            
+
+            if '---CHECKOUT---' not in result.stdout:
+                error_msg = f"Git fetch failed: {result.stderr}"
+                logger.error(f"❌ {error_msg}")
+                return {"status": "error", "error": error_msg}
+
+            # Checkout or pull had issues (e.g. merge conflicts)
+            logger.warning("⚠️ Git pull had issues: %s", result.stderr)
+
+            # Reset to remote state if there are conflicts
+            reset_result = subprocess.run([_GIT, 'reset', '--hard', f'origin/{self.target_branch}'],
+                                        stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE, text=True)
+
+            if reset_result.returncode == 0:
+                logger.info("✅ Git reset successful - repository synced")
+                return {
+                    "status": "success",
+                    "output": "Repository reset to match remote",
+                    "branch": self.target_branch,
+                    "fetch_result": fetch_result
+                }
+
+            error_msg = f"Git operations failed: {result.stderr}"
+            logger.error(f"❌ {error_msg}")
+            return {"status": "error", "error": error_msg}
+
         except subprocess.CalledProcessError as e:
             error_msg = f"Git pull failed: {e.stderr if hasattr(e, 'stderr') else str(e)}"
             logger.error(f"❌ {error_msg}")
@@ -131,18 +316,88 @@ class GitHubSyncHandler:
             logger.error(f"❌ {error_msg}")
             return {"status": "error", "error": error_msg}
     
-    def install_dependencies(self):
+    def _run_git_pipeline(self):
+        """Checkout, pull and diff in a single shell invocation"""
+        script = (
+            f'{_GIT} checkout {self.target_branch} && '
+            f'pre=$({_GIT} rev-parse HEAD) && '
+            f'{_GIT} pull origin {self.target_branch} && '
+            'echo __CHANGED__ && '
+            f'{_GIT} diff --name-only "$pre" HEAD'
+        )
+        try:
+            logger.info("📥 Pulling latest changes from GitHub...")
+
+            result = subprocess.run(['bash', '-c', script],
+                                  capture_output=True, text=True)
+
+            if result.returncode == 0:
+                pull_output, _, changed = result.stdout.partition('__CHANGED__')
+                changed_files = changed.split()
+                logger.info("✅ Git pull successful: %s", pull_output.strip())
+                return {
+                    "status": "success",
+                    "output": pull_output.strip(),
+                    "branch": self.target_branch,
+                    "changed_files": changed_files
+                }
+
+            # Try to handle merge conflicts or other issues
+            logger.warning("⚠️ Git pipeline had issues: %s", result.stderr)
+
+            # Reset to remote state if there are conflicts
+            reset_result = subprocess.run([_GIT, 'reset', '--hard', f'origin/{self.target_branch}'],
+                                        capture_output=True, text=True)
+
+            if reset_result.returncode == 0:
+                logger.info("✅ Git reset successful - repository synced")
+                return {
+                    "status": "success",
+                    "output": "Repository reset to match remote",
+                    "branch": self.target_branch,
+                    "changed_files": []
+                }
+
+            error_msg = f"Git operations failed: {result.stderr}"
+            logger.error(f"❌ {error_msg}")
+            return {"status": "error", "error": error_msg}
+
+        except Exception as e:
+            error_msg = f"Unexpected error during git pipeline: {str(e)}"
+            logger.error(f"❌ {error_msg}")
+            return {"status": "error", "error": error_msg}
+
+    def install_dependencies(self, changed_files=None):
         """Install/update dependencies if requirements changed"""
         try:
             logger.info("📦 Checking for dependency updates...")
-            
-            # Check if requirements.txt was modified
-            result = subprocess.run(['git', 'diff', '--name-only', 'HEAD~1', 'HEAD'], 
-                                  capture_output=True, text=True)
-            
-            if 'requirements.txt' in result.stdout:
+
+            if changed_files is None:
+                # Check if requirements.txt was modified
+                if self._repo is not None:
+                    try:
+                        repo = self._repo
+                        new_tree = repo.head.peel(pygit2.Commit).tree
+                        old_tree = repo.revparse_single('HEAD~1').tree
+                        diff = old_tree.diff_to_tree(new_tree)
+                        changed_files = [d.delta.new_file.path for d in diff]
+                    except Exception:
+                        # No parent commit to diff against - install to be safe
+                        changed_files = ['requirements.txt']
+                else:
+                    result = subprocess.run([_GIT, 'diff', '--name-only', 'HEAD~1', 'HEAD'],
+                                          capture_output=True, text=True)
+                    changed_files = result.stdout.split()
+
+            if 'requirements.txt' in changed_files:
                 logger.info("📦 Requirements.txt changed, updating dependencies...")
-                subprocess.run(['pip', 'install', '-r', 'requirements.txt'], check=True)
+                if _UV:
+                    installer = [_UV, 'pip', 'install', '--system', '-r', 'requirements.txt']
+                else:
+                    installer = [_PIP, 'install', '-r', 'requirements.txt']
+                # Installer progress output is noise here; keep stderr for failures
+                subprocess.run(installer, check=True,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                 logger.info("✅ Dependencies updated successfully")
                 return {"status": "updated", "message": "Dependencies updated"}
             else:
@@ -150,24 +405,61 @@ class GitHubSyncHandler:
                 return {"status": "skipped", "message": "No dependency changes"}
                 
         except subprocess.CalledProcessError as e:
-            error_msg = f"Dependency installation failed: {e}"
+            error_msg = f"Dependency installation failed: {e.stderr or e}"
             logger.error(f"❌ {error_msg}")
             return {"status": "error", "error": error_msg}
     
+    def _pid_is_managed(self, pid: int) -> bool:
+        """True when pid is a live process actually running APP_SCRIPT"""
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                cmdline = f.read().split(b'\0')
+            return any(arg.endswith(self.APP_SCRIPT.encode()) for arg in cmdline)
+        except OSError:
+            return False
+
     def restart_application(self):
-        """Restart the application after sync"""
+        """Restart the previously started application after sync"""
         try:
             logger.info("🔄 Application restart requested...")
-            
-            # For Replit, we don't actually restart the main process
-            # Instead, we just reload any changed modules if possible
-            logger.info("⚠️ Application restart skipped in Replit environment")
-            logger.info("💡 Changes will take effect on next manual restart or deployment")
-            
-            return {"status": "skipped", "message": "Restart not needed in Replit - changes synced"}
-            
+
+            # Only restart an instance this process started: without a PID
+            # file nothing is under our management, and spawning APP_SCRIPT
+            # here would start a server the operator may never have run.
+            if not (os.path.exists(self.PID_FILE) and os.path.exists(self.APP_SCRIPT)):
+                logger.info("⚠️ Application restart skipped - no managed instance running")
+                logger.info("💡 Changes will take effect on next manual restart or deployment")
+                return {"status": "skipped", "message": "Restart not needed in Replit - changes synced"}
+
+            try:
+                with open(self.PID_FILE) as f:
+                    old_pid = int(f.read().strip())
+            except ValueError:
+                old_pid = None
+
+            # PIDs get recycled - only signal when the kernel confirms the
+            # pid still belongs to our script, never an unrelated process
+            if old_pid is not None and self._pid_is_managed(old_pid):
+                try:
+                    os.kill(old_pid, signal.SIGTERM)
+                    logger.info("🛑 Sent SIGTERM to previous instance (pid %s)", old_pid)
+                except ProcessLookupError:
+                    logger.info("⚠️ Previous instance (pid %s) already gone", old_pid)
+            else:
+                logger.info("⚠️ Stale PID file - previous instance already gone")
+
+            # The webhook responder must keep running, so spawn the app in
+            # its own session instead of exec'ing over this process
+            process = subprocess.Popen([sys.executable, self.APP_SCRIPT],
+                                       start_new_session=True)
+            with open(self.PID_FILE, 'w') as f:
+                f.write(str(process.pid))
+
+            logger.info("✅ Application restarted (pid %s)", process.pid)
+            return {"status": "restarted", "message": f"Application restarted with pid {process.pid}"}
+
         except Exception as e:
-            error_msg = f"Application restart check failed: {e}"
+            error_msg = f"Application restart failed: {e}"
             logger.error(f"❌ {error_msg}")
             return {"status": "error", "error": error_msg}
     
@@ -178,13 +470,26 @@ class GitHubSyncHandler:
             branch = payload.get('ref', '').replace('refs/heads/', '')
             commits = payload.get('commits', [])
             
-            logger.info(f"📨 Received push to {repository}:{branch} with {len(commits)} commits")
-            
+            logger.info("📨 Received push to %s:%s with %d commits", repository, branch, len(commits))
+
+            # Branch deletes and tag pushes carry no commits - nothing to pull
+            if not commits or payload.get('deleted') or payload.get('after', '') == '0' * 40:
+                logger.info("⏭️ Ignoring no-op push (no commits)")
+                return {"status": "ignored", "reason": "no-op push"}
+
             # Only process pushes to target branch
             if branch != self.target_branch:
-                logger.info(f"⏭️ Ignoring push to {branch} (target: {self.target_branch})")
+                logger.info("⏭️ Ignoring push to %s (target: %s)", branch, self.target_branch)
                 return {"status": "ignored", "reason": f"Not target branch ({self.target_branch})"}
-            
+
+            # Return the cached result for retry deliveries of the same push
+            push_key = payload.get('after') or payload.get('head_commit', {}).get('id')
+            if push_key:
+                cached = self._recent_pushes.get(push_key)
+                if cached and time.monotonic() - cached[0] < self.RECENT_PUSH_TTL:
+                    logger.info("⏭️ Duplicate delivery for %s - returning cached result", push_key[:8])
+                    return cached[1]
+
             # Execute sync workflow
             results = {
                 "repository": repository,
@@ -193,25 +498,33 @@ class GitHubSyncHandler:
                 "steps": {}
             }
             
-            # Step 1: Pull changes
-            pull_result = self.pull_latest_changes()
+            # Step 1: Pull changes and collect the diff in one subprocess
+            pull_result = self._run_git_pipeline()
             results["steps"]["pull"] = pull_result
-            
+
             if pull_result["status"] == "error":
                 return results
-            
-            # Step 2: Update dependencies
-            deps_result = self.install_dependencies()
-            results["steps"]["dependencies"] = deps_result
-            
-            # Step 3: Restart application
+
+            # Steps 2 and 3 are independent once the pull is done - run the
+            # dependency update and the restart concurrently
+            deps_future = _DEPLOY_POOL.submit(
+                self.install_dependencies, pull_result.get("changed_files"))
+
             if self.auto_deploy:
-                restart_result = self.restart_application()
-                results["steps"]["restart"] = restart_result
+                restart_future = _DEPLOY_POOL.submit(self.restart_application)
+                results["steps"]["restart"] = restart_future.result()
             else:
                 results["steps"]["restart"] = {"status": "skipped", "message": "Auto-deploy disabled"}
+
+            results["steps"]["dependencies"] = deps_future.result()
             
             logger.info("🎉 GitHub sync completed successfully")
+
+            if push_key:
+                self._recent_pushes[push_key] = (time.monotonic(), results)
+                while len(self._recent_pushes) > self.RECENT_PUSH_LIMIT:
+                    self._recent_pushes.popitem(last=False)
+
             return results
             
         except Exception as e:
@@ -224,52 +537,75 @@ sync_handler = GitHubSyncHandler()
 
 def create_sync_app():
     """Create Flask app for GitHub sync webhook"""
+    # Imported here so that using GitHubSyncHandler from this module doesn't
+    # pay the Flask import cost
+    from flask import Flask, Response, request
+
     app = Flask(__name__)
+
+    def _json_response(body, status=200):
+        return Response(_dumps(body), status=status, mimetype='application/json')
+
+    # The status payload is constant for the process lifetime - serialize
+    # it once instead of per GET
+    _status_body = json.dumps({
+        "github_secret_configured": bool(sync_handler.github_secret),
+        "auto_deploy_enabled": sync_handler.auto_deploy,
+        "target_branch": sync_handler.target_branch,
+        "webhook_url": f"{REPL_URL}/github-sync"
+    }).encode('utf-8')
+    _status_etag = hashlib.sha256(_status_body).hexdigest()
     
     @app.route('/github-sync', methods=['POST'])
     def handle_github_webhook():
         """Handle GitHub webhook for automatic sync"""
         try:
-            # Verify signature
             signature = request.headers.get('X-Hub-Signature-256')
-            if not sync_handler.verify_signature(request.data, signature):
-                logger.warning("❌ Invalid webhook signature")
-                return jsonify({"error": "Invalid signature"}), 401
-            
-            payload = request.get_json()
             event_type = request.headers.get('X-GitHub-Event')
-            
-            logger.info(f"📨 Received GitHub event: {event_type}")
-            
+
+            # Stream the body through the HMAC instead of materializing
+            # request.data first; only push events need the bytes afterwards
+            valid, body = sync_handler.verify_signature_stream(
+                request.stream, signature, keep_body=(event_type == 'push'))
+            if not valid:
+                logger.warning("❌ Invalid webhook signature")
+                return _json_response({"error": "Invalid signature"}, 401)
+
+            logger.info("📨 Received GitHub event: %s", event_type)
+
             if event_type == 'push':
+                try:
+                    payload = _loads(body) if body else {}
+                except ValueError:
+                    payload = {}
                 result = sync_handler.handle_push_event(payload)
-                return jsonify({
+                return _json_response({
                     "status": "processed",
                     "event": "push",
                     "result": result
-                }), 200
+                })
             else:
-                logger.info(f"⏭️ Ignoring event type: {event_type}")
-                return jsonify({
+                logger.info("⏭️ Ignoring event type: %s", event_type)
+                return _json_response({
                     "status": "ignored",
                     "event": event_type,
                     "message": "Event type not processed"
-                }), 200
+                })
                 
         except Exception as e:
             error_msg = f"Error processing GitHub webhook: {e}"
             logger.error(f"❌ {error_msg}")
-            return jsonify({"error": error_msg}), 500
+            return _json_response({"error": error_msg}, 500)
     
     @app.route('/sync-status', methods=['GET'])
     def sync_status():
         """Get current sync configuration status"""
-        return jsonify({
-            "github_secret_configured": bool(sync_handler.github_secret),
-            "auto_deploy_enabled": sync_handler.auto_deploy,
-            "target_branch": sync_handler.target_branch,
-            "webhook_url": f"{os.environ.get('REPL_URL', 'your-repl-url')}/github-sync"
-        })
+        # Pollers (monitoring, uptime checks) can revalidate for free - the
+        # body only changes when the process restarts with new config
+        if request.headers.get('If-None-Match') == _status_etag:
+            return Response(status=304, headers={'ETag': _status_etag})
+        return Response(_status_body, mimetype='application/json',
+                        headers={'ETag': _status_etag, 'Cache-Control': 'max-age=15'})
     
     @app.route('/manual-sync', methods=['POST'])
     def manual_sync():
@@ -280,19 +616,21 @@ def create_sync_app():
             # Pull changes
             pull_result = sync_handler.pull_latest_changes()
             if pull_result["status"] == "error":
-                return jsonify(pull_result), 500
+                return _json_response(pull_result, 500)
             
             # Update dependencies
             deps_result = sync_handler.install_dependencies()
             
-            # Restart if requested
-            restart_requested = request.json.get('restart', True) if request.json else True
+            # Restart if requested - parse the body once instead of probing
+            # request.json twice
+            body = request.get_json(silent=True) or {}
+            restart_requested = body.get('restart', True)
             restart_result = None
             
             if restart_requested:
                 restart_result = sync_handler.restart_application()
             
-            return jsonify({
+            return _json_response({
                 "status": "success",
                 "pull": pull_result,
                 "dependencies": deps_result,
@@ -300,7 +638,7 @@ def create_sync_app():
             })
             
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return _json_response({"error": str(e)}, 500)
     
     return app
 
@@ -308,5 +646,35 @@ if __name__ == '__main__':
     app = create_sync_app()
     port = int(os.environ.get('SYNC_PORT', 5001))
     print(f"🔄 Starting GitHub Sync Server on port {port}")
-    print(f"🔗 Webhook URL: {os.environ.get('REPL_URL', 'your-repl-url')}/github-sync")
-    app.run(host='0.0.0.0', port=port, debug=True)
+    print(f"🔗 Webhook URL: {REPL_URL}/github-sync")
+
+    if os.getenv('FLASK_ENV') == 'development':
+        app.run(host='0.0.0.0', port=port, debug=True)
+    else:
+        try:
+            # Prefer an async transport when available - uvloop's event loop
+            # batches socket syscalls far better than threaded WSGI
+            import asyncio
+            from asgiref.wsgi import WsgiToAsgi
+            from hypercorn.asyncio import serve as hypercorn_serve
+            from hypercorn.config import Config
+
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+                print("⚡ Serving with hypercorn + uvloop")
+            except ImportError:
+                print("⚡ Serving with hypercorn (asyncio loop)")
+
+            config = Config()
+            config.bind = [f'0.0.0.0:{port}']
+            config.backlog = 128
+            asyncio.run(hypercorn_serve(WsgiToAsgi(app), config))
+        except ImportError:
+            # The Werkzeug debug server is single-threaded; waitress is the
+            # threaded fallback when the async stack isn't installed.
+            # recv_bytes is sized to a typical GitHub push payload so most
+            # bodies arrive in one recv call
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=port, threads=8,
+                  recv_bytes=65536)
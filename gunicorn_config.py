@@ -9,12 +9,14 @@ import multiprocessing
 bind = "0.0.0.0:5000"
 backlog = 2048
 
-# Worker processes
+# Worker processes: threaded workers so webhook handlers that block on
+# OpenAI/git don't monopolize a whole process
 workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"
+worker_class = "gthread"
+threads = 8
 worker_connections = 1000
-timeout = 30
-keepalive = 2
+timeout = 120
+keepalive = 75
 
 # Restart workers after this many requests, to help prevent memory leaks
 max_requests = 1000
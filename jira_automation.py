@@ -4,124 +4,459 @@ Jira Automation System
 Automatically implements code changes based on Jira ticket requests
 """
 
+import asyncio
+import functools
 import os
 import json
+import re
 import hmac
 import hashlib
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from flask import Flask, request, jsonify
+from typing import Dict, List, Any, Optional, Tuple
+from flask import Flask, g, request, jsonify
+import httpx
 import requests
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+
+# orjson parses webhook payloads and LLM replies several times faster
+# than the stdlib
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data):
+        return json.loads(data)
+
+# Redis backs the analysis cache when available; the agent works without it
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# RQ offloads ticket processing to worker processes; without it webhooks
+# are handled inline as before
+try:
+    from rq import Queue
+except ImportError:
+    Queue = None
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
+# Keyword sets for the no-AI fallback classifier; set intersection beats
+# rescanning the summary once per keyword
+_BUG_KW = frozenset({'bug', 'fix', 'error', 'broken'})
+_UI_KW = frozenset({'ui', 'interface', 'design', 'style'})
+_FEAT_KW = frozenset({'add', 'new', 'feature', 'implement'})
+_WORD_RE = re.compile(r'[a-z]+')
+_WS_RE = re.compile(r'\s+')
+
+
+def _normalize_text(text: str) -> str:
+    """Case-fold and collapse whitespace so cosmetic edits hash identically"""
+    return _WS_RE.sub(' ', text.strip().lower())
+
+# All static instructions live in the system message so providers can
+# cache the shared prefix; only the ticket fields travel in the (short)
+# user message
+_SYSTEM_PROMPT = """You analyze Jira tickets for a Todo application and provide implementation guidance.
+
+Current Todo App Features:
+- Add/edit/delete todos
+- Mark todos complete/incomplete
+- Set priority levels (Low/Medium/High)
+- View statistics
+- Basic web interface
+
+For each ticket you receive, provide a JSON response with:
+1. "change_type": "feature", "bugfix", "ui", or "enhancement"
+2. "files_to_modify": List of files that need changes
+3. "implementation_steps": Detailed steps to implement
+4. "code_changes": Specific code modifications needed
+5. "testing_strategy": How to test the changes
+6. "deployment_notes": Any deployment considerations
+
+Focus on practical, implementable changes for the existing todo app structure."""
+
+# Separators between the dynamic ticket fields, allocated once
+_PROMPT_SUMMARY = "Summary: "
+_PROMPT_DESCRIPTION = "\nDescription: "
+_PROMPT_TYPE = "\nType: "
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """Return the first balanced top-level JSON object in text, or None.
+
+    Models sometimes wrap the JSON in prose or code fences. A single
+    forward scan with brace counting finds the object without the
+    backtracking a DOTALL regex can hit on malformed output.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _classify(summary: str) -> str:
+    """Keyword classification of a ticket summary.
+
+    Pure function of the summary, so webhook replays and retries hit the
+    memo instead of re-tokenizing.
+    """
+    tokens = set(_WORD_RE.findall(summary.lower()))
+    if tokens & _BUG_KW:
+        return "bugfix"
+    if tokens & _UI_KW:
+        return "ui"
+    if tokens & _FEAT_KW:
+        return "feature"
+    return "enhancement"
+
+@dataclass(slots=True, frozen=True)
+class TicketData:
+    """Compact, immutable view of the Jira fields the agent needs.
+
+    Slots keep per-webhook allocations small and attribute access beats
+    repeated dict.get calls on the hot path.
+    """
+    key: str = ''
+    summary: str = ''
+    description: str = ''
+    issue_type: str = ''
+    priority: str = ''
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'TicketData':
+        """Build from a raw Jira webhook payload"""
+        issue = payload.get('issue', {})
+        fields = issue.get('fields', {})
+        return cls(
+            key=issue.get('key', ''),
+            summary=fields.get('summary', ''),
+            description=fields.get('description', ''),
+            issue_type=(fields.get('issuetype') or {}).get('name', ''),
+            priority=(fields.get('priority') or {}).get('name', '')
+        )
+
+# Plan files and test-case exports are fire-and-forget artifacts; writing
+# them on a small I/O pool lets ticket processing move on to the next step
+# instead of blocking on the disk
+_io_pool = ThreadPoolExecutor(max_workers=4)
+
+def _log_write_failure(future):
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"❌ Background file write failed: {exc}")
+
+def _get_test_generator():
+    """Import the in-tree test case generator once and reuse it.
+
+    Running the generator in-process skips the interpreter startup and
+    module imports a subprocess would pay per ticket; the instance itself
+    is the process-wide singleton from fixed_test_generator_2.
+    """
+    from fixed_test_generator_2 import get_generator
+    return get_generator()
+
 class JiraAutomationAgent:
     """AI agent for processing Jira tickets and implementing code changes"""
-    
+
+    # Cached analyses expire after a week; bump the version when the prompt
+    # changes so stale answers aren't replayed
+    ANALYSIS_CACHE_TTL = 604800
+    ANALYSIS_PROMPT_VERSION = 'v2'
+
+    # Bug tickets whose summary is shorter than this (and that carry no
+    # description) don't give the LLM enough signal to beat the keyword
+    # classifier - skip the round trip for them entirely
+    TEMPLATE_SUMMARY_MAX_LEN = 40
+
     def __init__(self):
         self.openai_client = None
         self.setup_openai()
-        
+        self.cache = None
+        self.setup_cache()
+
+    def setup_cache(self):
+        """Initialize the Redis analysis cache if configured"""
+        redis_url = os.getenv('REDIS_URL')
+        if redis is None or not redis_url:
+            logger.info("ℹ️ Redis not configured - analysis caching disabled")
+            return
+        try:
+            self.cache = redis.Redis.from_url(redis_url)
+            logger.info("✅ Redis analysis cache initialized")
+        except Exception as e:
+            logger.error(f"❌ Redis initialization failed: {e}")
+
+    def _analysis_cache_key(self, summary: str, description: str, issue_type: str) -> str:
+        """Cache key over everything that influences the analysis
+
+        Fields are normalized first so retriggered or bot-cloned tickets
+        that differ only in case or whitespace hit the same entry.
+        """
+        fingerprint = (f"{_normalize_text(summary)}\x1f{_normalize_text(description)}"
+                       f"\x1f{_normalize_text(issue_type)}\x1fgpt-4o\x1f{self.ANALYSIS_PROMPT_VERSION}")
+        return "jira:analysis:" + hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+
+    def invalidate_analysis(self, summary: str, description: str, issue_type: str):
+        """Drop the cached analysis for a ticket (e.g. after an update)"""
+        if self.cache:
+            try:
+                self.cache.delete(self._analysis_cache_key(summary, description, issue_type))
+            except Exception as e:
+                logger.error(f"❌ Cache invalidation failed: {e}")
+
     def setup_openai(self):
-        """Initialize OpenAI client"""
+        """Initialize the OpenAI client (batches build their own async client per run)"""
+        self.openai_api_key = None
         try:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
-                self.openai_client = OpenAI(api_key=api_key)
+                # Pooled client with keep-alive so repeat calls skip DNS/TLS
+                self.openai_client = OpenAI(
+                    api_key=api_key,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                    )
+                )
+                self.openai_api_key = api_key
                 logger.info("✅ OpenAI client initialized")
             else:
                 logger.warning("⚠️ OpenAI API key not found - AI features disabled")
         except Exception as e:
             logger.error(f"❌ OpenAI initialization failed: {e}")
     
-    def analyze_jira_ticket(self, ticket_data: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_jira_ticket(self, ticket_data: TicketData) -> Dict[str, Any]:
         """Analyze Jira ticket and determine required changes"""
         try:
-            summary = ticket_data.get('summary', '')
-            description = ticket_data.get('description', '')
-            issue_type = ticket_data.get('issuetype', {}).get('name', '')
-            
-            logger.info(f"🎫 Analyzing ticket: {summary}")
-            
-            # Use AI to analyze the ticket if available
-            if self.openai_client:
-                analysis = self._ai_analyze_ticket(summary, description, issue_type)
+            logger.info("🎫 Analyzing ticket: %s", ticket_data.summary)
+
+            # Use AI to analyze the ticket if available and worthwhile
+            if self.openai_client and not self._template_sufficient(ticket_data):
+                analysis = self._ai_analyze_ticket(
+                    ticket_data.summary, ticket_data.description, ticket_data.issue_type)
             else:
-                analysis = self._fallback_analyze_ticket(summary, description, issue_type)
-            
+                analysis = self._fallback_analyze_ticket(
+                    ticket_data.summary, ticket_data.description, ticket_data.issue_type)
+
             return analysis
-            
+
         except Exception as e:
             logger.error(f"❌ Error analyzing ticket: {e}")
             return {'error': str(e)}
     
+    def _template_sufficient(self, ticket_data: TicketData) -> bool:
+        """True when the keyword-template analysis will do without the LLM"""
+        return (ticket_data.issue_type.lower() == 'bug'
+                and len(ticket_data.summary) < self.TEMPLATE_SUMMARY_MAX_LEN
+                and not ticket_data.description)
+
+    def _cached_analysis(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a previously cached analysis, or None"""
+        if self.cache:
+            try:
+                cached = self.cache.get(cache_key)
+                if cached:
+                    logger.info("♻️ Using cached analysis")
+                    return _loads(cached)
+            except Exception as e:
+                logger.error(f"❌ Cache lookup failed: {e}")
+        return None
+
+    def _store_analysis(self, cache_key: str, analysis: Dict[str, Any]):
+        """Cache a well-formed analysis for replay"""
+        if self.cache:
+            try:
+                self.cache.setex(cache_key, self.ANALYSIS_CACHE_TTL, _dumps(analysis))
+            except Exception as e:
+                logger.error(f"❌ Cache write failed: {e}")
+
+    def _parse_analysis(self, result: Optional[str]) -> Tuple[Dict[str, Any], bool]:
+        """Parse the model reply as JSON; flags whether it is worth caching"""
+        if not result:
+            return {"ai_response": "Empty response", "change_type": "manual_review"}, False
+
+        try:
+            return _loads(result), True
+        except ValueError:  # covers both json and orjson decode errors
+            pass
+
+        # Salvage a JSON object wrapped in prose or code fences
+        candidate = _extract_json_object(result)
+        if candidate:
+            try:
+                return _loads(candidate), True
+            except ValueError:
+                pass
+
+        return {"ai_response": result, "change_type": "manual_review"}, False
+
     def _ai_analyze_ticket(self, summary: str, description: str, issue_type: str) -> Dict[str, Any]:
         """Use AI to analyze ticket and generate implementation plan"""
         try:
-            prompt = f"""
-            Analyze this Jira ticket for a Todo application and provide implementation guidance:
-            
-            Summary: {summary}
-            Description: {description}
-            Type: {issue_type}
-            
-            Current Todo App Features:
-            - Add/edit/delete todos
-            - Mark todos complete/incomplete
-            - Set priority levels (Low/Medium/High)
-            - View statistics
-            - Basic web interface
-            
-            Provide a JSON response with:
-            1. "change_type": "feature", "bugfix", "ui", or "enhancement"
-            2. "files_to_modify": List of files that need changes
-            3. "implementation_steps": Detailed steps to implement
-            4. "code_changes": Specific code modifications needed
-            5. "testing_strategy": How to test the changes
-            6. "deployment_notes": Any deployment considerations
-            
-            Focus on practical, implementable changes for the existing todo app structure.
-            """
-            
+            # Cache-aside: identical ticket content skips the OpenAI round trip
+            cache_key = self._analysis_cache_key(summary, description, issue_type)
+            cached = self._cached_analysis(cache_key)
+            if cached is not None:
+                return cached
+
+            prompt = self._build_analysis_prompt(summary, description, issue_type)
+
             if self.openai_client:
                 response = self.openai_client.chat.completions.create(
                     model="gpt-4o",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.1
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0,
+                    seed=42
                 )
-                
-                result = response.choices[0].message.content
-                # Try to parse as JSON, fallback to structured text if needed
-                try:
-                    if result:
-                        return json.loads(result)
-                    else:
-                        return {"ai_response": "Empty response", "change_type": "manual_review"}
-                except json.JSONDecodeError:
-                    return {"ai_response": result, "change_type": "manual_review"}
+
+                analysis, cacheable = self._parse_analysis(response.choices[0].message.content)
+                if cacheable:
+                    self._store_analysis(cache_key, analysis)
+                return analysis
             else:
                 return self._fallback_analyze_ticket(summary, description, issue_type)
-                
+
         except Exception as e:
             logger.error(f"❌ AI analysis failed: {e}")
             return self._fallback_analyze_ticket(summary, description, issue_type)
-    
+
+    async def _ai_analyze_ticket_async(self, client, summary: str, description: str, issue_type: str) -> Dict[str, Any]:
+        """Async twin of _ai_analyze_ticket, used for concurrent batch analysis"""
+        try:
+            cache_key = self._analysis_cache_key(summary, description, issue_type)
+            cached = self._cached_analysis(cache_key)
+            if cached is not None:
+                return cached
+
+            response = await client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": self._build_analysis_prompt(summary, description, issue_type)}
+                ],
+                temperature=0,
+                seed=42
+            )
+
+            analysis, cacheable = self._parse_analysis(response.choices[0].message.content)
+            if cacheable:
+                self._store_analysis(cache_key, analysis)
+            return analysis
+
+        except Exception as e:
+            logger.error(f"❌ AI analysis failed: {e}")
+            return self._fallback_analyze_ticket(summary, description, issue_type)
+
+    def analyze_batch(self, tickets: List[Dict[str, Any]],
+                      on_result=None) -> List[Dict[str, Any]]:
+        """Analyze a burst of tickets concurrently over one connection pool
+
+        Wall-clock time is roughly the slowest single analysis rather than
+        the sum of all of them. When on_result is given it is called as
+        on_result(index, analysis) the moment each analysis completes, so
+        downstream handling overlaps the analyses still in flight instead
+        of idling until the whole batch lands. The returned list is always
+        in ticket order.
+        """
+        def _fields(ticket):
+            return (
+                ticket.get('summary', ''),
+                ticket.get('description', ''),
+                ticket.get('issuetype', {}).get('name', '')
+            )
+
+        # Bulk creations (sprint start, CSV import) routinely contain
+        # identical tickets. Analyze each distinct field tuple once and
+        # fan the result out to every duplicate, so N clones cost one call.
+        groups: Dict[Tuple[str, str, str], List[int]] = {}
+        for i, t in enumerate(tickets):
+            groups.setdefault(_fields(t), []).append(i)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tickets)
+
+        def _deliver(indexes, analysis):
+            for i in indexes:
+                if on_result:
+                    on_result(i, analysis)
+                results[i] = analysis
+
+        if not self.openai_api_key:
+            for fields, indexes in groups.items():
+                _deliver(indexes, self._fallback_analyze_ticket(*fields))
+            return results
+
+        async def _run():
+            # Fresh client per batch: httpx pools their connections and
+            # locks to the event loop they were created in, so a client
+            # shared across successive asyncio.run() calls dies with
+            # "Event loop is closed" on the second batch.
+            client = AsyncOpenAI(
+                api_key=self.openai_api_key,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+                )
+            )
+            try:
+                async def _one(fields):
+                    analysis = await self._ai_analyze_ticket_async(client, *fields)
+                    return fields, analysis
+
+                for future in asyncio.as_completed([_one(f) for f in groups]):
+                    fields, analysis = await future
+                    _deliver(groups[fields], analysis)
+            finally:
+                await client.close()
+
+        asyncio.run(_run())
+        return results
+
+    def _build_analysis_prompt(self, summary: str, description: str, issue_type: str) -> str:
+        """Build the (dynamic-only) ticket message from the precomputed fragments"""
+        return ''.join((_PROMPT_SUMMARY, summary,
+                        _PROMPT_DESCRIPTION, description,
+                        _PROMPT_TYPE, issue_type))
+
     def _fallback_analyze_ticket(self, summary: str, description: str, issue_type: str) -> Dict[str, Any]:
         """Fallback analysis when AI is not available"""
-        change_type = "enhancement"
-        
-        # Basic keyword detection
-        if any(word in summary.lower() for word in ['bug', 'fix', 'error', 'broken']):
-            change_type = "bugfix"
-        elif any(word in summary.lower() for word in ['ui', 'interface', 'design', 'style']):
-            change_type = "ui"
-        elif any(word in summary.lower() for word in ['add', 'new', 'feature', 'implement']):
-            change_type = "feature"
+        change_type = _classify(summary)
         
         return {
             "change_type": change_type,
@@ -141,7 +476,7 @@ class JiraAutomationAgent:
     def implement_changes(self, analysis: Dict[str, Any], ticket_key: str) -> Dict[str, Any]:
         """Implement the code changes based on analysis"""
         try:
-            logger.info(f"🔧 Implementing changes for {ticket_key}")
+            logger.info("🔧 Implementing changes for %s", ticket_key)
             
             change_type = analysis.get('change_type', 'manual_review')
             files_to_modify = analysis.get('files_to_modify', [])
@@ -152,12 +487,18 @@ class JiraAutomationAgent:
                     'message': 'This ticket requires manual review and implementation'
                 }
             
+            # One clock read per ticket; the branch name and plan share it
+            now = datetime.now()
+
             # For now, create a branch and implementation plan
-            branch_name = f"jira-{ticket_key.lower()}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-            
-            # Create implementation plan file
+            branch_name = f"jira-{ticket_key.lower()}-{now.strftime('%Y%m%d-%H%M%S')}"
+
+            # Create implementation plan file off-thread; nothing later in
+            # this ticket reads it back
             plan_file = f"implementation_plan_{ticket_key}.md"
-            self._create_implementation_plan(plan_file, analysis, ticket_key)
+            _io_pool.submit(
+                self._create_implementation_plan, plan_file, analysis, ticket_key, now
+            ).add_done_callback(_log_write_failure)
             
             return {
                 'status': 'plan_created',
@@ -171,21 +512,63 @@ class JiraAutomationAgent:
             logger.error(f"❌ Error implementing changes: {e}")
             return {'status': 'error', 'message': str(e)}
     
-    def _create_implementation_plan(self, plan_file: str, analysis: Dict[str, Any], ticket_key: str):
+    def generate_test_cases(self, ticket_data: TicketData) -> Dict[str, Any]:
+        """Generate test cases for a ticket using the in-tree generator.
+
+        The requirement is passed in memory and the generator runs in this
+        process - no subprocess, no temp requirements file.
+        """
+        try:
+            from fixed_test_generator_2 import Requirement
+
+            issue_key = ticket_data.key or 'JIRA-REQ'
+            requirement = Requirement(
+                id=issue_key,
+                text=f"{ticket_data.summary}. {ticket_data.description}".strip('. '),
+                priority=ticket_data.priority or 'Medium'
+            )
+
+            generator = _get_test_generator()
+            test_cases = generator.generate_test_cases_from_requirements([requirement])
+
+            output_file = f"jira_test_cases_{issue_key}.json"
+            _io_pool.submit(
+                generator.export_to_json, test_cases, output_file
+            ).add_done_callback(_log_write_failure)
+
+            logger.info("🧪 Generated %d test cases for %s", len(test_cases), issue_key)
+            return {
+                'status': 'generated',
+                'issue_key': issue_key,
+                'test_case_count': len(test_cases),
+                'output_file': output_file
+            }
+
+        except Exception as e:
+            logger.error(f"❌ Test case generation failed: {e}")
+            return {'status': 'error', 'message': str(e)}
+
+    def _create_implementation_plan(self, plan_file: str, analysis: Dict[str, Any],
+                                    ticket_key: str, now: Optional[datetime] = None):
         """Create a detailed implementation plan file"""
-        plan_content = f"""# Implementation Plan: {ticket_key}
+        if now is None:
+            now = datetime.now()
+
+        # Collect fragments and hand them to writelines in one go - no
+        # intermediate concatenated string
+        parts = [f"""# Implementation Plan: {ticket_key}
 
 ## Analysis Results
 - **Change Type**: {analysis.get('change_type', 'Unknown')}
 - **Files to Modify**: {', '.join(analysis.get('files_to_modify', []))}
 
 ## Implementation Steps
-"""
-        
-        for i, step in enumerate(analysis.get('implementation_steps', []), 1):
-            plan_content += f"{i}. {step}\n"
-        
-        plan_content += f"""
+"""]
+
+        parts.extend(f"{i}. {step}\n"
+                     for i, step in enumerate(analysis.get('implementation_steps', []), 1))
+
+        parts.append(f"""
 ## Code Changes Required
 {analysis.get('code_changes', 'See AI analysis above')}
 
@@ -196,13 +579,13 @@ class JiraAutomationAgent:
 {analysis.get('deployment_notes', 'Standard deployment process')}
 
 ## Generated At
-{datetime.now().isoformat()}
-"""
-        
-        with open(plan_file, 'w') as f:
-            f.write(plan_content)
+{now.isoformat()}
+""")
+
+        with open(plan_file, 'w', buffering=1 << 16) as f:
+            f.writelines(parts)
         
-        logger.info(f"📋 Implementation plan created: {plan_file}")
+        logger.info("📋 Implementation plan created: %s", plan_file)
 
 class JiraWebhookHandler:
     """Handles incoming Jira webhooks"""
@@ -210,21 +593,46 @@ class JiraWebhookHandler:
     def __init__(self):
         self.agent = JiraAutomationAgent()
         self.webhook_secret = os.getenv('JIRA_WEBHOOK_SECRET', '')
+        # Encode the secret once; verification only needs the bytes
+        self._secret_bytes = self.webhook_secret.encode('utf-8')
+        self.queue = None
+        self.setup_queue()
+        # O(1) event dispatch; anything not in the table is ignored
+        self._handlers = {
+            'jira:issue_created': self._process_issue_created,
+            'jira:issue_updated': self._handle_issue_updated,
+        }
+
+    def setup_queue(self):
+        """Initialize the RQ task queue if Redis is configured"""
+        redis_url = os.getenv('REDIS_URL')
+        if Queue is None or redis is None or not redis_url:
+            logger.info("ℹ️ RQ not configured - webhooks processed inline")
+            return
+        try:
+            self.queue = Queue('jira', connection=redis.Redis.from_url(redis_url))
+            logger.info("✅ RQ task queue initialized")
+        except Exception as e:
+            logger.error(f"❌ Task queue initialization failed: {e}")
     
     def verify_webhook_signature(self, payload: bytes, signature: str) -> bool:
         """Verify Jira webhook signature"""
-        if not self.webhook_secret:
+        if not self._secret_bytes:
             logger.warning("⚠️ No webhook secret configured - skipping verification")
             return True
-        
+
+        if not signature.startswith('sha256='):
+            return False
+
         try:
             expected_signature = hmac.new(
-                self.webhook_secret.encode('utf-8'),
+                self._secret_bytes,
                 payload,
                 hashlib.sha256
             ).hexdigest()
-            
-            return hmac.compare_digest(f"sha256={expected_signature}", signature)
+
+            # Strip the prefix from the header instead of formatting a new string
+            return hmac.compare_digest(expected_signature, signature.removeprefix('sha256='))
         except Exception as e:
             logger.error(f"❌ Signature verification failed: {e}")
             return False
@@ -233,45 +641,42 @@ class JiraWebhookHandler:
         """Process incoming Jira webhook"""
         try:
             webhook_event = payload.get('webhookEvent', '')
-            
-            if webhook_event == 'jira:issue_created':
-                return self._handle_issue_created(payload)
-            elif webhook_event == 'jira:issue_updated':
-                return self._handle_issue_updated(payload)
-            else:
+            handler = self._handlers.get(webhook_event)
+
+            if handler is None:
                 return {'status': 'ignored', 'reason': f'Event type {webhook_event} not handled'}
-                
+            return handler(payload)
+
         except Exception as e:
             logger.error(f"❌ Error processing webhook: {e}")
             return {'status': 'error', 'message': str(e)}
+
+    def _process_issue_created(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue new-issue processing, falling back to inline handling"""
+        # Heavy work (OpenAI call, file I/O) goes to a worker so the
+        # request thread is free for the next webhook
+        if self.queue:
+            try:
+                job = self.queue.enqueue(process_ticket_job, payload, job_timeout=300)
+                return {'status': 'queued', 'job_id': job.id}
+            except Exception as e:
+                logger.error(f"❌ Enqueue failed - processing inline: {e}")
+        return self._handle_issue_created(payload)
     
     def _handle_issue_created(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle new issue creation"""
         try:
-            issue = payload.get('issue', {})
-            fields = issue.get('fields', {})
-            issue_key = issue.get('key', '')
-            
-            logger.info(f"🆕 New Jira issue created: {issue_key}")
-            
-            # Extract ticket information
-            ticket_data = {
-                'key': issue_key,
-                'summary': fields.get('summary', ''),
-                'description': fields.get('description', ''),
-                'issuetype': fields.get('issuetype', {}),
-                'priority': fields.get('priority', {}),
-                'assignee': fields.get('assignee', {}),
-                'reporter': fields.get('reporter', {})
-            }
-            
+            ticket_data = TicketData.from_payload(payload)
+
+            logger.info("🆕 New Jira issue created: %s", ticket_data.key)
+
             # Analyze and implement
             analysis = self.agent.analyze_jira_ticket(ticket_data)
-            implementation = self.agent.implement_changes(analysis, issue_key)
-            
+            implementation = self.agent.implement_changes(analysis, ticket_data.key)
+
             return {
                 'status': 'processed',
-                'issue_key': issue_key,
+                'issue_key': ticket_data.key,
                 'analysis': analysis,
                 'implementation': implementation
             }
@@ -282,11 +687,15 @@ class JiraWebhookHandler:
     
     def _handle_issue_updated(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle issue updates"""
-        issue = payload.get('issue', {})
-        issue_key = issue.get('key', '')
-        
-        logger.info(f"📝 Jira issue updated: {issue_key}")
-        
+        ticket_data = TicketData.from_payload(payload)
+        issue_key = ticket_data.key
+
+        logger.info("📝 Jira issue updated: %s", issue_key)
+
+        # Edited tickets invalidate any cached analysis of their old content
+        self.agent.invalidate_analysis(
+            ticket_data.summary, ticket_data.description, ticket_data.issue_type)
+
         # For now, we'll only process new issues
         # Issue updates could trigger re-analysis if needed
         return {
@@ -299,21 +708,66 @@ class JiraWebhookHandler:
 app = Flask(__name__)
 webhook_handler = JiraWebhookHandler()
 
+# Raw-body markers for the events we actually handle, derived from the
+# dispatch table so the fast-path scan can never drift out of sync with it
+_HANDLED_EVENT_MARKERS = tuple(
+    event.encode('utf-8') for event in webhook_handler._handlers)
+
+def process_ticket_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """RQ job entry point - must be a top-level function so workers can import it"""
+    return webhook_handler._handle_issue_created(payload)
+
+@app.before_request
+def stamp_request_time():
+    """One clock read per request; handlers reuse g.now_iso"""
+    g.now = datetime.now()
+    g.now_iso = g.now.isoformat()
+
 @app.route('/jira-webhook', methods=['POST'])
 def jira_webhook():
     """Jira webhook endpoint"""
     try:
-        payload = request.get_json()
+        # Read the raw body exactly once: verify the HMAC over it, then
+        # parse JSON from the same buffer (no Flask-side caching or reparse)
+        raw = request.get_data(cache=False)
         signature = request.headers.get('X-Hub-Signature-256', '')
-        
+
         # Verify signature
-        if not webhook_handler.verify_webhook_signature(request.data, signature):
+        if not webhook_handler.verify_webhook_signature(raw, signature):
             return jsonify({'error': 'Invalid signature'}), 401
-        
+
+        # Jira retries deliveries on timeout; claim the webhook id with
+        # SET NX so a retry never repeats the LLM call or plan write
+        cache = webhook_handler.agent.cache
+        if cache:
+            wid = (request.headers.get('X-Atlassian-Webhook-Identifier')
+                   or hashlib.sha256(raw).hexdigest())
+            try:
+                if not cache.set(f'jira:wh:{wid}', '1', nx=True, ex=3600):
+                    return jsonify({'status': 'duplicate', 'webhook_id': wid}), 200
+            except Exception as e:
+                logger.error(f"❌ Dedup check failed: {e}")
+
+        # Cheap bytes scan before the full parse: events we don't handle
+        # (worklogs, comments, sprint changes...) are often the bulk of the
+        # traffic and can carry 100+ KB of changelog we'd parse just to
+        # throw away. The event name appears verbatim in the body, so a
+        # substring miss on every handled event means the payload is
+        # ignorable without decoding it.
+        if not any(event in raw for event in _HANDLED_EVENT_MARKERS):
+            return jsonify({'status': 'ignored', 'reason': 'Event type not handled'}), 200
+
+        try:
+            payload = _loads(raw)
+        except ValueError:
+            return jsonify({'error': 'Invalid JSON payload'}), 400
+
         # Process webhook
         result = webhook_handler.process_webhook(payload)
-        
-        return jsonify(result), 200
+
+        # Queued tickets are accepted, not yet processed
+        status_code = 202 if result.get('status') == 'queued' else 200
+        return jsonify(result), status_code
         
     except Exception as e:
         logger.error(f"❌ Webhook endpoint error: {e}")
@@ -325,12 +779,13 @@ def jira_webhook_verify():
     return jsonify({
         'status': 'active',
         'service': 'Jira Automation Webhook',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': g.now_iso
     })
 
 @app.route('/automation/status')
 def automation_status():
     """Get automation system status"""
+    cache_info = _classify.cache_info()
     return jsonify({
         'status': 'running',
         'services': {
@@ -338,9 +793,39 @@ def automation_status():
             'ai_agent': 'active' if webhook_handler.agent.openai_client else 'disabled',
             'deployment': 'configured'
         },
-        'timestamp': datetime.now().isoformat()
+        'classifier_cache': {
+            'hits': cache_info.hits,
+            'misses': cache_info.misses,
+            'size': cache_info.currsize
+        },
+        'timestamp': g.now_iso
     })
 
+@app.route('/automation/analyze-batch', methods=['POST'])
+def analyze_batch_endpoint():
+    """Analyze several tickets in one request
+
+    Accepts {"issues": [{"summary": ..., "description": ..., "issuetype":
+    {"name": ...}}, ...]} and fans the LLM calls out concurrently, so a
+    burst of tickets costs roughly one analysis of wall-clock time.
+    """
+    try:
+        payload = request.get_json(silent=True) or {}
+        issues = payload.get('issues', [])
+        if not isinstance(issues, list) or not issues:
+            return jsonify({'error': 'issues must be a non-empty list'}), 400
+
+        analyses = webhook_handler.agent.analyze_batch(issues)
+        return jsonify({
+            'status': 'completed',
+            'count': len(analyses),
+            'analyses': analyses,
+            'timestamp': g.now_iso
+        })
+    except Exception as e:
+        logger.error(f"❌ Batch analysis endpoint error: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/automation/test', methods=['POST'])
 def test_automation():
     """Test the automation with a sample ticket"""
@@ -364,4 +849,17 @@ if __name__ == '__main__':
     print("🤖 Starting Jira Automation System...")
     print("🔗 Webhook endpoint: http://localhost:5001/jira-webhook")
     print("📊 Status endpoint: http://localhost:5001/automation/status")
-    app.run(host='0.0.0.0', port=5001, debug=True)
\ No newline at end of file
+
+    if os.getenv('FLASK_ENV') == 'development':
+        # Reloader and debugger only in development; both add per-request cost
+        app.run(host='0.0.0.0', port=5001, debug=True)
+    else:
+        # Werkzeug's dev server handles one request at a time. Serve
+        # threaded in production (or run under gunicorn with
+        # gunicorn_config.py for multi-process workers).
+        try:
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=5001, threads=8)
+        except ImportError:
+            logger.warning("⚠️ waitress not installed - falling back to the Flask dev server")
+            app.run(host='0.0.0.0', port=5001)
\ No newline at end of file
@@ -12,10 +12,34 @@ from unified_automation import UnifiedAutomationSystem
 # Create a combined Flask application
 app = Flask(__name__)
 
+# The environment doesn't change after startup; read it once instead of
+# per status request
+REPL_URL = os.getenv('REPL_URL', 'your-repl-url')
+_JIRA_WEBHOOK_URL = f"{REPL_URL}/jira-webhook"
+_GITHUB_WEBHOOK_URL = f"{REPL_URL}/github-webhook"
+
 # Initialize managers
 todo_manager = TodoManager()
 automation_system = UnifiedAutomationSystem()
 
+# Per-todo fragment, parsed once at import; format() fills the slots per row
+_TODO_ITEM_TEMPLATE = """
+            <div class="todo-item {completed_class}">
+                <form action="/toggle/{id}" method="post" style="display: inline;">
+                    <input type="checkbox" {checked} onchange="this.form.submit()">
+                </form>
+                <strong>{title}</strong>
+                <span style="color: #666;">({priority})</span>
+                <br>
+                <small>{description}</small>
+                <br>
+                <small style="color: #999;">Created: {created}</small>
+                <form action="/delete/{id}" method="post" style="display: inline; float: right;">
+                    <button type="submit" class="delete-btn" onclick="return confirm('Delete this todo?')">Delete</button>
+                </form>
+            </div>
+        """
+
 # Todo App routes
 @app.route('/')
 def index():
@@ -91,34 +115,27 @@ def index():
             <h3>Your Todos</h3>
     """
     
+    # Collect per-todo fragments and join once; += on a str is quadratic
+    parts = [html]
+
     for todo in todos:
-        checked = "checked" if todo.completed else ""
-        completed_class = "completed" if todo.completed else ""
-        
-        html += f"""
-            <div class="todo-item {completed_class}">
-                <form action="/toggle/{todo.id}" method="post" style="display: inline;">
-                    <input type="checkbox" {checked} onchange="this.form.submit()">
-                </form>
-                <strong>{todo.title}</strong>
-                <span style="color: #666;">({todo.priority})</span>
-                <br>
-                <small>{todo.description}</small>
-                <br>
-                <small style="color: #999;">Created: {todo.created_at[:10]}</small>
-                <form action="/delete/{todo.id}" method="post" style="display: inline; float: right;">
-                    <button type="submit" class="delete-btn" onclick="return confirm('Delete this todo?')">Delete</button>
-                </form>
-            </div>
-        """
-    
-    html += """
+        parts.append(_TODO_ITEM_TEMPLATE.format(
+            completed_class="completed" if todo.completed else "",
+            checked="checked" if todo.completed else "",
+            id=todo.id,
+            title=todo.title,
+            priority=todo.priority,
+            description=todo.description,
+            created=todo.created_at[:10]
+        ))
+
+    parts.append("""
         </div>
     </body>
     </html>
-    """
-    
-    return html
+    """)
+
+    return ''.join(parts)
 
 @app.route('/add', methods=['POST'])
 def add_todo():
@@ -183,8 +200,8 @@ def automation_status():
         },
         'endpoints': {
             'main_app': '/',
-            'jira_webhook_url': f"{os.getenv('REPL_URL', 'your-repl-url')}/jira-webhook",
-            'github_webhook_url': f"{os.getenv('REPL_URL', 'your-repl-url')}/github-webhook"
+            'jira_webhook_url': _JIRA_WEBHOOK_URL,
+            'github_webhook_url': _GITHUB_WEBHOOK_URL
         },
         'timestamp': datetime.now().isoformat()
     }
@@ -6,9 +6,19 @@ Sets up both Jira and GitHub webhooks for the unified automation system
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime
 
+# One pooled session for every outbound call: repeat requests to the same
+# host reuse the TCP/TLS connection, and transient failures retry with
+# backoff (429/5xx) instead of failing the setup outright.
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))))
+
+
 def setup_secrets_guide():
     """Display guide for setting up secrets"""
     print("🔧 REQUIRED SECRETS CONFIGURATION")
@@ -84,7 +94,7 @@ def setup_github_webhook():
     api_url = f"https://api.github.com/repos/{github_owner}/{github_repo}/hooks"
     
     try:
-        response = requests.get(api_url, headers=headers)
+        response = _session.get(api_url, headers=headers)
         if response.status_code == 200:
             webhooks = response.json()
             for webhook in webhooks:
@@ -110,7 +120,7 @@ def setup_github_webhook():
         webhook_config["config"]["secret"] = webhook_secret
     
     try:
-        response = requests.post(api_url, headers=headers, json=webhook_config)
+        response = _session.post(api_url, headers=headers, json=webhook_config)
         
         if response.status_code == 201:
             webhook_data = response.json()
@@ -134,7 +144,7 @@ def test_automation_system():
     
     # Test automation system status
     try:
-        response = requests.get("http://127.0.0.1:8000/automation/status", timeout=5)
+        response = _session.get("http://127.0.0.1:8000/automation/status", timeout=5)
         if response.status_code == 200:
             status = response.json()
             print("✅ Automation system is running")
@@ -150,7 +160,7 @@ def test_automation_system():
     # Test with sample Jira ticket
     try:
         print("\n🎫 Testing Jira automation...")
-        response = requests.post("http://127.0.0.1:8000/test/jira", timeout=10)
+        response = _session.post("http://127.0.0.1:8000/test/jira", timeout=10)
         if response.status_code == 200:
             result = response.json()
             print(f"✅ Jira test successful")
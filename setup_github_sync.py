@@ -7,9 +7,18 @@ Run this to configure GitHub webhooks and test the sync functionality
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime
 
+# One pooled session for every outbound call: repeat requests to the same
+# host reuse the TCP/TLS connection, and transient failures retry with
+# backoff (429/5xx) instead of failing the setup outright.
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))))
+
 def setup_github_webhook():
     """Setup GitHub webhook for automatic sync"""
     
@@ -53,7 +62,7 @@ def setup_github_webhook():
     try:
         # Create webhook
         api_url = f"https://api.github.com/repos/{github_owner}/{github_repo}/hooks"
-        response = requests.post(api_url, headers=headers, json=webhook_config)
+        response = _session.post(api_url, headers=headers, json=webhook_config)
         
         if response.status_code == 201:
             webhook_data = response.json()
@@ -87,11 +96,11 @@ def test_sync_functionality():
     try:
         test_url = local_url
         try:
-            response = requests.get(f"{test_url}/sync-status", timeout=5)
+            response = _session.get(f"{test_url}/sync-status", timeout=5)
         except requests.exceptions.ConnectionError:
             # If local fails, try external URL
             test_url = replit_url
-            response = requests.get(f"{test_url}/sync-status", timeout=10)
+            response = _session.get(f"{test_url}/sync-status", timeout=10)
         
         if response.status_code == 200:
             status = response.json()
@@ -110,12 +119,12 @@ def test_sync_functionality():
         print("\n🔄 Testing manual sync...")
         test_url = local_url
         try:
-            response = requests.post(f"{test_url}/manual-sync", 
+            response = _session.post(f"{test_url}/manual-sync", 
                                    json={"restart": False}, timeout=5)
         except requests.exceptions.ConnectionError:
             # If local fails, try external URL
             test_url = replit_url
-            response = requests.post(f"{test_url}/manual-sync", 
+            response = _session.post(f"{test_url}/manual-sync", 
                                    json={"restart": False}, timeout=10)
         
         if response.status_code == 200:
@@ -3,6 +3,7 @@ Implementation for TEST-GITHUB-001: Test GitHub integration with sample feature
 Generated automatically by Replit AI Integration
 """
 
+import functools
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
@@ -11,64 +12,50 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class TestGithub001:
+# Issue Type: Feature
+# Summary: Test GitHub integration with sample feature
+# Description: This is a test issue to verify GitHub integration functionality including branch creation, file generation, and PR creation.
+
+ISSUE_KEY = "TEST-GITHUB-001"
+
+# TODO: Add validation logic based on acceptance criteria; until there is
+# any, validation is a constant rather than a method call per run
+_VALIDATED = True
+
+@functools.cache
+def execute() -> Dict[str, Any]:
     """
-    Implementation class for TEST-GITHUB-001
-    
-    Issue Type: Feature
-    Summary: Test GitHub integration with sample feature
-    Description: This is a test issue to verify GitHub integration functionality including branch creation, file generation, and PR creation.
+    Main execution method for TEST-GITHUB-001
+
+    Idempotent: repeat calls return the cached result.
+
+    Returns:
+        Dict containing execution results
     """
-    
-    def __init__(self):
-        self.issue_key = "TEST-GITHUB-001"
-        self.created_at = datetime.now()
-        logger.info(f"Initialized {self.__class__.__name__} for {self.issue_key}")
-    
-    def execute(self) -> Dict[str, Any]:
-        """
-        Main execution method for TEST-GITHUB-001
-        
-        Returns:
-            Dict containing execution results
-        """
-        try:
-            logger.info(f"Starting execution for {self.issue_key}")
-            
-            # TODO: Implement actual functionality based on ticket requirements
-            # Refer to the feature specification in features/TEST-GITHUB-001.md
-            
-            result = {
-                "status": "completed",
-                "issue_key": self.issue_key,
-                "execution_time": datetime.now(),
-                "message": "Implementation placeholder - customize based on requirements"
-            }
-            
-            logger.info(f"Successfully executed {self.issue_key}")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error executing {self.issue_key}: {str(e)}")
-            raise
-    
-    def validate(self) -> bool:
-        """
-        Validate implementation meets requirements
-        
-        Returns:
-            bool: True if validation passes
-        """
-        # TODO: Add validation logic based on acceptance criteria
-        logger.info(f"Validating {self.issue_key} implementation")
-        return True
+    try:
+        logger.info(f"Starting execution for {ISSUE_KEY}")
+
+        # TODO: Implement actual functionality based on ticket requirements
+        # Refer to the feature specification in features/TEST-GITHUB-001.md
+
+        result = {
+            "status": "completed",
+            "issue_key": ISSUE_KEY,
+            "execution_time": datetime.now(),
+            "message": "Implementation placeholder - customize based on requirements"
+        }
+
+        logger.info(f"Successfully executed {ISSUE_KEY}")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error executing {ISSUE_KEY}: {str(e)}")
+        raise
 
 # Usage example
 if __name__ == "__main__":
-    implementation = TestGithub001()
-    
-    if implementation.validate():
-        result = implementation.execute()
+    if _VALIDATED:
+        result = execute()
         print(f"Implementation result: {result}")
     else:
         print("Validation failed")
@@ -14,8 +14,13 @@ app = Flask(__name__)
 
 class TodoItem:
     """Represents a single todo item"""
-    
-    def __init__(self, id: str, title: str, description: str = "", completed: bool = False, 
+
+    # Fixed attribute set: no per-instance __dict__, which roughly halves
+    # the memory of a loaded todo list and speeds attribute access
+    __slots__ = ('id', 'title', 'description', 'completed', 'priority',
+                 'created_at', 'updated_at')
+
+    def __init__(self, id: str, title: str, description: str = "", completed: bool = False,
                  priority: str = "Medium", created_at: Optional[str] = None):
         self.id = id
         self.title = title
@@ -132,6 +137,24 @@ class TodoManager:
 todo_manager = TodoManager()
 
 # Routes
+# Per-todo fragment, parsed once at import; format() fills the slots per row
+_TODO_ITEM_TEMPLATE = """
+            <div class="todo-item {completed_class}">
+                <form action="/toggle/{id}" method="post" style="display: inline;">
+                    <input type="checkbox" {checked} onchange="this.form.submit()">
+                </form>
+                <strong>{title}</strong>
+                <span style="color: #666;">({priority})</span>
+                <br>
+                <small>{description}</small>
+                <br>
+                <small style="color: #999;">Created: {created}</small>
+                <form action="/delete/{id}" method="post" style="display: inline; float: right;">
+                    <button type="submit" class="delete-btn" onclick="return confirm('Delete this todo?')">Delete</button>
+                </form>
+            </div>
+        """
+
 @app.route('/')
 def index():
     """Main todo list page"""
@@ -202,34 +225,27 @@ def index():
             <h3>Your Todos</h3>
     """
     
+    # Collect per-todo fragments and join once; += on a str is quadratic
+    parts = [html]
+
     for todo in todos:
-        checked = "checked" if todo.completed else ""
-        completed_class = "completed" if todo.completed else ""
-        
-        html += f"""
-            <div class="todo-item {completed_class}">
-                <form action="/toggle/{todo.id}" method="post" style="display: inline;">
-                    <input type="checkbox" {checked} onchange="this.form.submit()">
-                </form>
-                <strong>{todo.title}</strong>
-                <span style="color: #666;">({todo.priority})</span>
-                <br>
-                <small>{todo.description}</small>
-                <br>
-                <small style="color: #999;">Created: {todo.created_at[:10]}</small>
-                <form action="/delete/{todo.id}" method="post" style="display: inline; float: right;">
-                    <button type="submit" class="delete-btn" onclick="return confirm('Delete this todo?')">Delete</button>
-                </form>
-            </div>
-        """
-    
-    html += """
+        parts.append(_TODO_ITEM_TEMPLATE.format(
+            completed_class="completed" if todo.completed else "",
+            checked="checked" if todo.completed else "",
+            id=todo.id,
+            title=todo.title,
+            priority=todo.priority,
+            description=todo.description,
+            created=todo.created_at[:10]
+        ))
+
+    parts.append("""
         </div>
     </body>
     </html>
-    """
-    
-    return html
+    """)
+
+    return ''.join(parts)
 
 @app.route('/add', methods=['POST'])
 def add_todo():
@@ -11,36 +11,66 @@ import hmac
 import hashlib
 import subprocess
 import logging
+import queue
+import threading
 import requests
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from flask import Flask, request, jsonify
+import httpx
 from openai import OpenAI
 
+# orjson parses webhook payloads and LLM replies several times faster
+# than the stdlib
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data):
+        return json.loads(data)
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# The environment doesn't change after startup; read it once instead of
+# per status request
+REPL_URL = os.getenv('REPL_URL', 'your-repl-url')
+_JIRA_WEBHOOK_URL = f"{REPL_URL}/jira-webhook"
+_GITHUB_WEBHOOK_URL = f"{REPL_URL}/github-webhook"
+
 class TodoCodeModifier:
     """Handles automatic code modifications for the todo app"""
     
     def __init__(self):
         self.app_file = "todo_app.py"
-        
+        # O(1) change-type dispatch, built once; anything not in the table
+        # falls through to manual review
+        self._implementers = {
+            'feature': self._add_feature,
+            'ui': self._modify_ui,
+            'enhancement': self._add_enhancement,
+        }
+
     def implement_feature(self, analysis: Dict[str, Any], ticket_key: str) -> Dict[str, Any]:
         """Implement a feature based on AI analysis"""
         try:
             change_type = analysis.get('change_type', 'manual_review')
-            
-            if change_type == 'feature':
-                return self._add_feature(analysis, ticket_key)
-            elif change_type == 'ui':
-                return self._modify_ui(analysis, ticket_key)
-            elif change_type == 'enhancement':
-                return self._add_enhancement(analysis, ticket_key)
-            else:
+            implementer = self._implementers.get(change_type)
+
+            if implementer is None:
                 return {'status': 'manual_review_required', 'message': 'Complex changes require manual implementation'}
-                
+            return implementer(analysis, ticket_key)
+
         except Exception as e:
             logger.error(f"❌ Error implementing feature: {e}")
             return {'status': 'error', 'message': str(e)}
@@ -260,27 +290,86 @@ class TodoCodeModifier:
     def _create_git_commit(self, message: str):
         """Create a git commit with the changes"""
         try:
-            subprocess.run(['git', 'add', '.'], check=True)
-            subprocess.run(['git', 'commit', '-m', message], check=True)
+            # The modifier only edits tracked files, so commit -a stages
+            # and commits in one subprocess - half the process spawns, and
+            # unlike 'git add .' it can't sweep unrelated untracked files
+            # into an automated commit
+            subprocess.run(['git', 'commit', '-am', message], check=True)
             logger.info(f"✅ Git commit created: {message}")
         except subprocess.CalledProcessError as e:
             logger.warning(f"⚠️ Git commit failed: {e}")
 
+# Static analysis instructions, composed once at import. Only the ticket
+# fields vary per call, so they travel in the user message while this
+# constant rides in the system message (identical prefix across calls,
+# which provider-side prompt caching can reuse).
+_ANALYSIS_SYSTEM_PROMPT = """Analyze Jira tickets for a Todo application and provide implementation guidance.
+
+Current Todo App Features:
+- Add/edit/delete todos with title, description, priority
+- Mark todos complete/incomplete
+- View statistics (total, completed, pending)
+- Simple web interface with forms
+- JSON persistence
+
+Respond with JSON containing:
+{
+    "change_type": "feature|bugfix|ui|enhancement",
+    "complexity": "simple|medium|complex",
+    "implementation_approach": "automatic|assisted|manual",
+    "code_changes": "specific description of what to implement",
+    "files_to_modify": ["todo_app.py"],
+    "implementation_steps": ["step1", "step2", "step3"],
+    "testing_notes": "how to test the changes"
+}
+
+For simple features like "add due date" or "add categories", use implementation_approach: "automatic"
+"""
+
+_PROMPT_SUMMARY = "Summary: "
+_PROMPT_DESCRIPTION = "\nDescription: "
+_PROMPT_TYPE = "\nType: "
+
+# Classifier phrase lists for the no-AI fallback, built once at import
+# instead of as fresh list literals on every call. Substring matching, so
+# multi-word phrases are fine.
+_BUG_PHRASES = ('bug', 'fix', 'error', 'broken')
+_UI_PHRASES = ('ui', 'interface', 'design', 'style')
+_FEATURE_PHRASES = ('add', 'new', 'feature')
+_AUTO_IMPL_PHRASES = ('due date', 'deadline', 'category', 'tag')
+
 class UnifiedAutomationSystem:
     """Main automation system handling both Jira and GitHub webhooks"""
-    
+
+    # How many processed (issue_key, updated) events to remember for
+    # dropping Jira's webhook retries
+    SEEN_EVENT_LIMIT = 1024
+
+    # How many ticket analyses to keep in the in-process LRU; near-duplicate
+    # tickets (clones, regression re-triggers) hit this instead of OpenAI
+    ANALYSIS_CACHE_LIMIT = 512
+
     def __init__(self):
         self.openai_client = self._setup_openai()
         self.code_modifier = TodoCodeModifier()
         self.jira_secret = os.getenv('JIRA_WEBHOOK_SECRET', '')
         self.github_secret = os.getenv('GITHUB_WEBHOOK_SECRET', '')
+        # Insertion-ordered so the oldest entries age out first
+        self._seen_events = OrderedDict()
+        self._analysis_cache = OrderedDict()
         
     def _setup_openai(self) -> Optional[OpenAI]:
         """Setup OpenAI client"""
         try:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
-                return OpenAI(api_key=api_key)
+                # Pooled client with keep-alive so repeat calls skip DNS/TLS
+                return OpenAI(
+                    api_key=api_key,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                    )
+                )
             else:
                 logger.warning("⚠️ OpenAI API key not found")
                 return None
@@ -304,50 +393,52 @@ class UnifiedAutomationSystem:
             logger.error(f"❌ Ticket analysis error: {e}")
             return {'error': str(e)}
     
+    def _analysis_cache_key(self, summary: str, description: str, issue_type: str) -> tuple:
+        """Normalized key so retitled clones of a ticket hit the same entry"""
+        return (' '.join(summary.lower().split()),
+                ' '.join(description[:500].lower().split()),
+                issue_type.lower())
+
     def _ai_analyze_ticket(self, summary: str, description: str, issue_type: str) -> Dict[str, Any]:
         """AI-powered ticket analysis"""
         try:
-            prompt = f"""
-            Analyze this Jira ticket for a Todo application and provide implementation guidance:
-            
-            Summary: {summary}
-            Description: {description}
-            Type: {issue_type}
-            
-            Current Todo App Features:
-            - Add/edit/delete todos with title, description, priority
-            - Mark todos complete/incomplete
-            - View statistics (total, completed, pending)
-            - Simple web interface with forms
-            - JSON persistence
-            
-            Respond with JSON containing:
-            {{
-                "change_type": "feature|bugfix|ui|enhancement",
-                "complexity": "simple|medium|complex",
-                "implementation_approach": "automatic|assisted|manual",
-                "code_changes": "specific description of what to implement",
-                "files_to_modify": ["todo_app.py"],
-                "implementation_steps": ["step1", "step2", "step3"],
-                "testing_notes": "how to test the changes"
-            }}
-            
-            For simple features like "add due date" or "add categories", use implementation_approach: "automatic"
-            """
-            
+            # LLM generation dominates the webhook's latency; duplicate and
+            # near-duplicate tickets (bot clones, re-triggers) are answered
+            # from the LRU instead
+            cache_key = self._analysis_cache_key(summary, description, issue_type)
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
+                logger.info("♻️ Using cached analysis")
+                return cached
+
+            # Only the ticket fields are assembled per call; the
+            # instructions live in _ANALYSIS_SYSTEM_PROMPT
+            prompt = ''.join((_PROMPT_SUMMARY, summary,
+                              _PROMPT_DESCRIPTION, description,
+                              _PROMPT_TYPE, issue_type))
+
             if self.openai_client:
                 response = self.openai_client.chat.completions.create(
                     model="gpt-4o",
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=[
+                        {"role": "system", "content": _ANALYSIS_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
                     temperature=0.1
                 )
                 
                 result = response.choices[0].message.content
                 if result:
                     try:
-                        return json.loads(result)
-                    except json.JSONDecodeError:
+                        analysis = _loads(result)
+                    except ValueError:  # covers both json and orjson decode errors
                         return {"ai_response": result, "change_type": "manual_review"}
+                    # Only well-formed analyses are worth replaying
+                    self._analysis_cache[cache_key] = analysis
+                    while len(self._analysis_cache) > self.ANALYSIS_CACHE_LIMIT:
+                        self._analysis_cache.popitem(last=False)
+                    return analysis
                 else:
                     return {"change_type": "manual_review", "message": "Empty AI response"}
             else:
@@ -364,14 +455,14 @@ class UnifiedAutomationSystem:
         
         # Simple keyword detection
         summary_lower = summary.lower()
-        if any(word in summary_lower for word in ['bug', 'fix', 'error', 'broken']):
+        if any(word in summary_lower for word in _BUG_PHRASES):
             change_type = "bugfix"
-        elif any(word in summary_lower for word in ['ui', 'interface', 'design', 'style']):
+        elif any(word in summary_lower for word in _UI_PHRASES):
             change_type = "ui"
-        elif any(word in summary_lower for word in ['add', 'new', 'feature']):
+        elif any(word in summary_lower for word in _FEATURE_PHRASES):
             change_type = "feature"
             # Check for simple features we can auto-implement
-            if any(word in summary_lower for word in ['due date', 'deadline', 'category', 'tag']):
+            if any(word in summary_lower for word in _AUTO_IMPL_PHRASES):
                 implementation_approach = "automatic"
         
         return {
@@ -400,7 +491,18 @@ class UnifiedAutomationSystem:
             issue = payload.get('issue', {})
             fields = issue.get('fields', {})
             issue_key = issue.get('key', '')
-            
+
+            # Jira retries webhooks on timeout and fires several events per
+            # transition; the same (issue, updated) pair means the same
+            # content, so rerunning the LLM pipeline would be wasted work
+            event_key = (issue_key, fields.get('updated') or fields.get('created', ''))
+            if event_key in self._seen_events:
+                logger.info(f"♻️ Duplicate webhook event for {issue_key} - skipping")
+                return {'status': 'duplicate', 'issue_key': issue_key}
+            self._seen_events[event_key] = True
+            while len(self._seen_events) > self.SEEN_EVENT_LIMIT:
+                self._seen_events.popitem(last=False)
+
             logger.info(f"🎫 Processing Jira issue: {issue_key}")
             
             # Extract ticket data
@@ -482,27 +584,73 @@ class UnifiedAutomationSystem:
 app = Flask(__name__)
 automation_system = UnifiedAutomationSystem()
 
+def _json_response(obj, status=200):
+    """jsonify on the orjson-backed serializer - bytes out, no re-encode"""
+    return app.response_class(_dumps(obj), status=status, mimetype='application/json')
+
+# Jira processing blocks on the LLM call, file writes and a git push -
+# far longer than Jira's webhook timeout. Hand the work to a small pool
+# and acknowledge immediately so retries don't pile up on busy workers.
+# The queue is bounded: when processing can't keep up, new events get a
+# 503 so Jira retries later instead of the backlog growing without limit.
+_WH_WORKERS = int(os.getenv('WH_WORKERS', '8'))
+_WORK_QUEUE = queue.Queue(maxsize=1024)
+
+def _drain_work_queue():
+    while True:
+        payload = _WORK_QUEUE.get()
+        try:
+            result = automation_system.process_jira_webhook(payload)
+            logger.info(f"✅ Background Jira processing finished: {result.get('status')}")
+        except Exception as e:
+            logger.error(f"❌ Background Jira processing failed: {e}")
+        finally:
+            _WORK_QUEUE.task_done()
+
+# Daemon threads, not an executor pool: the drain loop never returns, and
+# ThreadPoolExecutor's atexit hook would join those workers forever -
+# hanging every process that imports this module when it tries to exit.
+for _i in range(_WH_WORKERS):
+    threading.Thread(target=_drain_work_queue, daemon=True,
+                     name=f'jira-webhook-worker-{_i}').start()
+
 @app.route('/jira-webhook', methods=['POST'])
 def jira_webhook():
     """Jira webhook endpoint"""
     try:
-        payload = request.get_json()
-        result = automation_system.process_jira_webhook(payload)
-        return jsonify(result), 200
+        try:
+            payload = _loads(request.get_data(cache=False))
+        except ValueError:
+            return _json_response({'error': 'invalid JSON payload'}, 400)
+        issue_key = (payload or {}).get('issue', {}).get('key', '')
+        try:
+            _WORK_QUEUE.put_nowait(payload)
+        except queue.Full:
+            logger.warning(f"⚠️ Webhook queue full - asking Jira to retry {issue_key}")
+            return _json_response({'status': 'overloaded', 'issue_key': issue_key}, 503)
+        return _json_response({
+            'status': 'accepted',
+            'issue_key': issue_key,
+            'queued': _WORK_QUEUE.qsize(),
+            'timestamp': datetime.now().isoformat()
+        }, 202)
     except Exception as e:
         logger.error(f"❌ Jira webhook error: {e}")
-        return jsonify({'error': str(e)}), 500
+        return _json_response({'error': str(e)}, 500)
 
-@app.route('/github-webhook', methods=['POST'])  
+@app.route('/github-webhook', methods=['POST'])
 def github_webhook():
     """GitHub webhook endpoint"""
     try:
-        payload = request.get_json()
+        try:
+            payload = _loads(request.get_data(cache=False))
+        except ValueError:
+            return _json_response({'error': 'invalid JSON payload'}, 400)
         result = automation_system.process_github_webhook(payload)
-        return jsonify(result), 200
+        return _json_response(result)
     except Exception as e:
         logger.error(f"❌ GitHub webhook error: {e}")
-        return jsonify({'error': str(e)}), 500
+        return _json_response({'error': str(e)}, 500)
 
 @app.route('/automation/status')
 def automation_status():
@@ -516,8 +664,8 @@ def automation_status():
             'code_modifier': 'active'
         },
         'endpoints': {
-            'jira_webhook_url': f"{os.getenv('REPL_URL', 'your-repl-url')}/jira-webhook",
-            'github_webhook_url': f"{os.getenv('REPL_URL', 'your-repl-url')}/github-webhook"
+            'jira_webhook_url': _JIRA_WEBHOOK_URL,
+            'github_webhook_url': _GITHUB_WEBHOOK_URL
         },
         'timestamp': datetime.now().isoformat()
     })